@@ -16,6 +16,7 @@ class Config:
     MAX_EXCEL_COLS = 200
     MAX_FILE_SIZE_MB = 100
     LARGE_FILE_THRESHOLD_MB = 10
+    CSV_CHUNK_ROWS = 50000  # rows parsed per pandas chunk when streaming CSVs
     
     # Progress Reporting Thresholds
     PROGRESS_INTERVALS = {
@@ -35,6 +36,7 @@ class Config:
     # Encoding Detection
     ENCODING_FALLBACKS = ['utf-8', 'latin-1', 'cp1252', 'ascii', 'utf-16']
     ENCODING_CONFIDENCE_THRESHOLD = 0.7
+    ENCODING_PROBE_BYTES = 8192  # bytes read from the start of a file to pick its encoding
     
     # UI Settings
     WINDOW_WIDTH = 900
@@ -46,6 +48,7 @@ class Config:
     DEFAULT_EXPORT_FORMAT = 'csv'
     EXPORT_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
     MAX_URL_DISPLAY_LENGTH = 100
+    EXPORT_BUFFER_BYTES = 1024 * 1024  # exports reach the disk in writes of this size
     
     # Logging Settings
     ENABLE_CONSOLE_LOGGING = True
@@ -55,6 +58,10 @@ class Config:
     # Performance Settings
     THREAD_TIMEOUT_SECONDS = 300  # 5 minutes
     UI_UPDATE_INTERVAL_MS = 100
+    TEXT_INSERT_CHUNK_CHARS = 65536  # characters per output widget insert
+    MMAP_THRESHOLD_MB = 1  # text files at least this large are memory-mapped
+    RESULT_CACHE_SIZE = 8  # processed files whose results are kept for reuse
+    RESULT_CACHE_MAX_URLS = 200000  # URLs held across all cached results
     
     # Supported File Extensions
     SUPPORTED_EXTENSIONS = {
@@ -75,7 +82,7 @@ class Config:
         '.txt': 'process_text',
         '.html': 'process_html',
         '.htm': 'process_html',
-        '.xml': 'process_html'  # Use HTML processor for XML
+        '.xml': 'process_xml'
     }
     
     # Error Messages
@@ -124,7 +124,7 @@ def handle_exception(exception, logger=None):
                 exception.context
             )
         else:
-            logger.error(f"{type(exception).__name__}: {str(exception)}")
+            logger.error("%s: %s", type(exception).__name__, exception)
     
     # Return user-friendly message
     if isinstance(exception, FileValidationError):
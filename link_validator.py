@@ -1,13 +1,13 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-import pandas as pd
 from urllib.parse import urlparse
-from openpyxl import load_workbook
-from bs4 import BeautifulSoup
 import threading
 import csv
+import mmap
 import os
+import re
 import time
+from collections import OrderedDict
 from datetime import datetime
 from utils import (
     detect_encoding, get_progress_interval, safe_str_conversion,
@@ -18,6 +18,55 @@ from logger import get_logger
 from exceptions import *
 
 
+# Compiled once at import time and shared by every looks_like_url call
+_URL_INDICATOR_RE = re.compile(r'https?://|www\.|ftp://', re.IGNORECASE | re.ASCII)
+
+# ASCII form of the looks_like_domain_or_url rules: hyphen-free-edged
+# alphanumeric labels, a letter in the label before the TLD, and a TLD of
+# 2-20 letters or hyphens
+_DOMAIN_LABEL = r'[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?'
+_DOMAIN_RE = re.compile(
+    rf'(?:{_DOMAIN_LABEL}\.)*(?=[A-Za-z0-9-]*[A-Za-z]){_DOMAIN_LABEL}\.[A-Za-z-]{{2,20}}'
+)
+
+# Prefixes that _URL_INDICATOR_RE would match at the start of the text
+_URL_PREFIXES = ('http://', 'https://', 'ftp://', 'www.')
+
+# Substrings of lower-cased text that mark it as prose rather than a URL;
+# looks_like_url searches for all of them with one alternation
+_SENTENCE_INDICATORS = (
+    '. ', '! ', '? ', ', and ', ', or ', ' the ', ' a ', ' an ',
+    ' is ', ' are ', ' was ', ' were ', ' will ', ' can ', ' could ',
+    ' should ', ' would ', ' may ', ' might ', ' this ', ' that ',
+    ' these ', ' those ', ' with ', ' without ', ' from ', ' into ',
+    ' about ', ' through ', ' during ', ' before ', ' after ', ' over ',
+    ' under ', ' above ', ' below ', ' between ', ' among ', ' within '
+)
+_SENTENCE_RE = re.compile('|'.join(map(re.escape, _SENTENCE_INDICATORS)))
+
+# Text without a dot or a scheme separator can never pass looks_like_url,
+# so vectorized pre-filters use this to discard cells in bulk
+_URL_CANDIDATE_RE = re.compile(r'\.|://')
+
+# Non-empty lines of a raw text buffer, split on the same \n, \r and \r\n
+# boundaries as universal-newline text mode
+_LINE_RE = re.compile(rb'[^\r\n]+')
+
+# Scheme and netloc of an http(s) URL, split exactly where urlparse splits
+# them; ASCII mode keeps IGNORECASE from folding non-ASCII look-alikes
+_HTTP_NETLOC_RE = re.compile(r'https?://([^/?#]*)', re.IGNORECASE | re.ASCII)
+
+# Characters whose encoding shows whether an encoding is an ASCII superset
+_ASCII_PROBE = '\t\n\r .:/azAZ09'
+
+# C0 control characters, which urlparse strips or removes before splitting
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x1f]')
+
+# Results of previous runs keyed by (path, st_mtime_ns, st_size), so an
+# unchanged file is not re-read and re-scanned; oldest entries go first
+_RESULT_CACHE = OrderedDict()
+
+
 class LinkValidator:
     """Handles URL validation and file processing - simplified version"""
     
@@ -31,15 +80,37 @@ class LinkValidator:
         self.logger.info("Processing cancellation requested")
     
     def is_valid_url(self, url):
+        """Validate a URL, matching urllib.parse semantics"""
+        # safe_str_conversion maps None/NaN and blank values to ""
+        url_str = safe_str_conversion(url)
+        if not url_str:
+            return False
+        
+        # Numbers, dates and plain words are the common reject: an http(s)
+        # URL must start with 'h' unless control characters precede it
+        first = url_str[0]
+        if first != 'h' and first != 'H' and first > ' ':
+            return False
+        
+        # urlparse strips and removes control characters before splitting,
+        # so such strings take the full parse below
+        if not _CONTROL_CHAR_RE.search(url_str):
+            match = _HTTP_NETLOC_RE.match(url_str)
+            if match is None:
+                # urlparse only yields an http(s) scheme with a netloc
+                # when the string starts with http:// or https://
+                return False
+            
+            netloc = match.group(1)
+            # Non-ASCII and bracketed netlocs get extra checks in urlparse
+            if netloc.isascii() and '[' not in netloc and ']' not in netloc:
+                return bool(netloc) and not netloc.startswith('.') and not netloc.endswith('.')
+        
+        return self._is_valid_parsed_url(url, url_str)
+    
+    def _is_valid_parsed_url(self, url, url_str):
         """Validate a URL using urllib.parse"""
         try:
-            if pd.isna(url) or not str(url).strip():
-                return False
-                
-            url_str = safe_str_conversion(url)
-            if not url_str:
-                return False
-                
             result = urlparse(url_str)
             
             # Must have scheme and netloc
@@ -58,7 +129,7 @@ class LinkValidator:
             return True
             
         except Exception as e:
-            self.logger.debug(f"URL validation error for '{url}': {str(e)}")
+            self.logger.debug("URL validation error for '%s': %s", url, e)
             return False
 
     def process_csv(self, file_path, progress_callback=None):
@@ -81,76 +152,100 @@ class LinkValidator:
             
             self.logger.log_file_processing_start(file_path, file_info)
             
+            # Deferred so the GUI starts without paying for the pandas import
+            import pandas as pd
+            
             # Try to detect encoding
             encoding = detect_encoding(file_path)
+            encodings = [encoding] + [enc for enc in current_config.ENCODING_FALLBACKS if enc != encoding]
+            file_size = file_info.get('size_bytes', 0)
             
-            try:
-                df = pd.read_csv(file_path, encoding=encoding)
-            except UnicodeDecodeError:
-                # Try fallback encodings
-                for fallback_encoding in current_config.ENCODING_FALLBACKS:
-                    try:
-                        df = pd.read_csv(file_path, encoding=fallback_encoding, errors='ignore')
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    raise EncodingError(
-                        current_config.ERROR_MESSAGES['encoding_failed'],
-                        file_path=file_path,
-                        tried_encodings=current_config.ENCODING_FALLBACKS
-                    )
-            
-            total = len(df) * len(df.columns)
-            progress_interval = get_progress_interval(total)
-            processed = 0
-            
-            # Use sets to collect unique URLs
-            valid_urls = set()
-            invalid_urls = set()
-            
-            for column in df.columns:
-                if self.processing_cancelled:
+            for enc in encodings:
+                # Use sets to collect unique URLs
+                valid_urls = set()
+                invalid_urls = set()
+                
+                try:
+                    # Stream the file in chunks so peak memory is bounded by the
+                    # chunk size rather than the whole frame
+                    with open(file_path, 'rb') as f, pd.read_csv(
+                        f, encoding=enc, chunksize=current_config.CSV_CHUNK_ROWS
+                    ) as reader:
+                        for chunk in reader:
+                            if self.processing_cancelled:
+                                break
+                            
+                            self._collect_dataframe_urls(chunk, valid_urls, invalid_urls)
+                            
+                            if progress_callback and file_size:
+                                progress_callback(min(f.tell() / file_size, 1.0))
                     break
-                    
-                for index, value in df[column].items():
-                    if pd.notna(value):
-                        url_str = safe_str_conversion(value)
-                        
-                        # Only process cells that look like URLs
-                        if url_str and self.looks_like_url(url_str):
-                            if self.is_valid_url(url_str):
-                                valid_urls.add(url_str)
-                            else:
-                                invalid_urls.add(url_str)
-                    
-                    processed += 1
-                    if progress_callback and processed % progress_interval == 0:
-                        progress_callback(processed/total)
+                except UnicodeDecodeError:
+                    # A later chunk can fail to decode, so rescan with the next encoding
+                    self.logger.debug("CSV decoding with %s failed, trying next encoding", enc)
+            else:
+                raise EncodingError(
+                    current_config.ERROR_MESSAGES['encoding_failed'],
+                    file_path=file_path,
+                    tried_encodings=encodings
+                )
             
             # Ensure final progress update shows 100%
             if progress_callback:
                 progress_callback(1.0)
             
             # Convert sets to sorted lists
-            results['valid'] = sorted(list(valid_urls))
-            results['invalid'] = sorted(list(invalid_urls))
+            results['valid'] = sorted(valid_urls)
+            results['invalid'] = sorted(invalid_urls)
             
             processing_time = time.time() - start_time
-            self.logger.info(f"CSV processing complete: {len(results['valid'])} valid, {len(results['invalid'])} invalid unique URLs")
+            self.logger.info("CSV processing complete: %d valid, %d invalid unique URLs",
+                             len(results['valid']), len(results['invalid']))
             
         except Exception as e:
             if not isinstance(e, LinkValidatorError):
-                self.logger.error(f"Unexpected CSV processing error: {str(e)}")
+                self.logger.error("Unexpected CSV processing error: %s", e)
                 raise FileProcessingError(f"CSV processing failed: {str(e)}", file_path=file_path, file_type='csv')
             raise
         
         return results
 
+    def _collect_dataframe_urls(self, df, valid_urls, invalid_urls):
+        """Add URL-like cells of a DataFrame to the valid/invalid sets"""
+        import pandas as pd
+        
+        # Numeric columns never contain URL-like text; the rest are stacked
+        # into one Series so filtering and de-duplication are single C-level
+        # passes over the whole chunk rather than one per column
+        text_columns = [df[column] for column in df.columns
+                        if not pd.api.types.is_numeric_dtype(df[column])]
+        if not text_columns or self.processing_cancelled:
+            return
+        
+        cells = pd.concat(text_columns, ignore_index=True)
+        cells = cells[cells.notna()]
+        cells = cells[cells.astype(str).str.contains(_URL_CANDIDATE_RE)]
+        
+        # Results are sets, so each distinct cell value is classified once
+        for value in cells.drop_duplicates().tolist():
+            url_str = safe_str_conversion(value)
+            
+            # Values already classified in an earlier chunk are skipped
+            if url_str in valid_urls or url_str in invalid_urls:
+                continue
+            
+            # Only process cells that look like URLs
+            if url_str and self.looks_like_url(url_str):
+                if self.is_valid_url(url_str):
+                    valid_urls.add(url_str)
+                else:
+                    invalid_urls.add(url_str)
+
     def process_excel(self, file_path, progress_callback=None):
         """Process Excel files - only process cells that look like URLs"""
         results = {'valid': [], 'invalid': []}
         wb = None
+        calamine_wb = None
         start_time = time.time()
         
         try:
@@ -165,15 +260,42 @@ class LinkValidator:
                     max_size=current_config.MAX_FILE_SIZE_MB
                 )
             
-            wb = load_workbook(filename=file_path, read_only=True, data_only=True)
+            max_rows = current_config.MAX_EXCEL_ROWS
+            max_cols = current_config.MAX_EXCEL_COLS
             
-            # Calculate total cells
-            total_cells = 0
-            for ws in wb.worksheets:
-                if ws.max_row and ws.max_column:
-                    actual_rows = min(ws.max_row, current_config.MAX_EXCEL_ROWS)
-                    actual_cols = min(ws.max_column, current_config.MAX_EXCEL_COLS)
-                    total_cells += actual_rows * actual_cols
+            try:
+                # Optional native reader; far faster than openpyxl's pure-Python XML parsing
+                from python_calamine import CalamineWorkbook
+            except ImportError:
+                CalamineWorkbook = None
+            
+            if CalamineWorkbook is not None:
+                calamine_wb = CalamineWorkbook.from_path(file_path)
+                sheets = [calamine_wb.get_sheet_by_name(name) for name in calamine_wb.sheet_names]
+                
+                # Calculate total cells; a sheet's last used cell bounds the
+                # A1-based grid its rows are read into, and empty sheets have none
+                total_cells = sum(min(sheet.end[0] + 1, max_rows) * min(sheet.end[1] + 1, max_cols)
+                                  for sheet in sheets if sheet.end)
+                
+                # Rows are converted one sheet at a time as the scan reaches
+                # it; keeping the empty leading area lines rows and columns up
+                # with openpyxl's grid so the same limits apply
+                sheet_rows = (sheet.to_python(skip_empty_area=False, nrows=max_rows) for sheet in sheets)
+            else:
+                from openpyxl import load_workbook
+                
+                wb = load_workbook(filename=file_path, read_only=True, data_only=True)
+                
+                # Calculate total cells
+                total_cells = 0
+                for ws in wb.worksheets:
+                    if ws.max_row and ws.max_column:
+                        actual_rows = min(ws.max_row, max_rows)
+                        actual_cols = min(ws.max_column, max_cols)
+                        total_cells += actual_rows * actual_cols
+                
+                sheet_rows = [ws.iter_rows(values_only=True, max_row=max_rows) for ws in wb.worksheets]
             
             progress_interval = get_progress_interval(total_cells)
             processed = 0
@@ -181,133 +303,96 @@ class LinkValidator:
             # Use sets to collect unique URLs
             valid_urls = set()
             invalid_urls = set()
+            seen_texts = set()
             
-            for sheet in wb.worksheets:
+            for rows in sheet_rows:
                 if self.processing_cancelled:
                     break
                     
-                for row_num, row in enumerate(sheet.iter_rows(values_only=True, max_row=current_config.MAX_EXCEL_ROWS), 1):
+                for row in rows:
                     if self.processing_cancelled:
                         break
                         
-                    for col_num, cell_value in enumerate(row[:current_config.MAX_EXCEL_COLS], 1):
-                        if cell_value:
-                            cell_str = safe_str_conversion(cell_value)
-                            
-                            # Only process cells that look like URLs
-                            if cell_str and self.looks_like_url(cell_str):
-                                if self.is_valid_url(cell_str):
-                                    valid_urls.add(cell_str)
-                                else:
-                                    invalid_urls.add(cell_str)
+                    cells = row[:max_cols]
+                    
+                    # Only text cells can hold URLs; empty, numeric, date and
+                    # boolean cells are dropped for the whole row at once, and
+                    # text already seen elsewhere cannot change the result sets
+                    texts = {value for value in cells if isinstance(value, str)}
+                    texts -= seen_texts
+                    seen_texts |= texts
+                    
+                    for cell_value in texts:
+                        cell_str = cell_value.strip()
                         
-                        processed += 1
-                        if progress_callback and processed % progress_interval == 0:
-                            progress_callback(min(processed/total_cells, 1.0))
+                        # Only process cells that look like URLs
+                        if cell_str and self.looks_like_url(cell_str):
+                            if self.is_valid_url(cell_str):
+                                valid_urls.add(cell_str)
+                            else:
+                                invalid_urls.add(cell_str)
+                    
+                    reported = processed // progress_interval
+                    processed += len(cells)
+                    # Sheets saved without a dimension record report no size, so
+                    # their progress only shows at the end
+                    if progress_callback and total_cells and processed // progress_interval > reported:
+                        progress_callback(min(processed/total_cells, 1.0))
             
             # Ensure final progress update shows 100%
             if progress_callback:
                 progress_callback(1.0)
             
             # Convert sets to sorted lists
-            results['valid'] = sorted(list(valid_urls))
-            results['invalid'] = sorted(list(invalid_urls))
+            results['valid'] = sorted(valid_urls)
+            results['invalid'] = sorted(invalid_urls)
             
             processing_time = time.time() - start_time
-            self.logger.info(f"Excel processing complete: {len(results['valid'])} valid, {len(results['invalid'])} invalid unique URLs")
+            self.logger.info("Excel processing complete: %d valid, %d invalid unique URLs",
+                             len(results['valid']), len(results['invalid']))
             
         except Exception as e:
             if not isinstance(e, LinkValidatorError):
-                self.logger.error(f"Unexpected Excel processing error: {str(e)}")
+                self.logger.error("Unexpected Excel processing error: %s", e)
                 raise FileProcessingError(f"Excel processing failed: {str(e)}", file_path=file_path, file_type='excel')
             raise
         finally:
             if wb:
                 wb.close()
+            if calamine_wb:
+                calamine_wb.close()
         
         return results
 
     def looks_like_url(self, text):
-        """Check if text looks like a URL before validation - improved logic"""
+        """Check if text looks like a URL before validation - comprehensive logic"""
         text = text.strip()
         
-        # Empty or very short text
-        if len(text) < 4:
+        # Empty, very short, or too long (likely paragraph text)
+        length = len(text)
+        if length < 4 or length > 200:
             return False
         
-        # Should not be too long (likely paragraph text)
-        if len(text) > 200:
+        # Every indicator and every domain needs a dot or '://'; most
+        # non-URL text is rejected here by C-level substring scans
+        if '.' not in text and '://' not in text:
             return False
         
         # Should not contain too many spaces (likely sentence)
         if text.count(' ') > 2:
             return False
         
-        # Check for obvious URL patterns first
-        url_indicators = ['http://', 'https://', 'www.', 'ftp://']
-        if any(indicator in text.lower() for indicator in url_indicators):
+        # Clean URLs are the common case; a prefix test settles them
+        # without a scan of the whole string
+        if text.startswith(_URL_PREFIXES):
             return True
         
-        # Check for domain-like patterns (contains dots and looks like domain)
-        if '.' in text:
-            # Split by spaces to handle cases where URL might be in a sentence
-            words = text.split()
-            for word in words:
-                word = word.strip('.,!?()[]{}"\'-')  # Remove common punctuation
-                
-                # Check if word looks like a domain or URL
-                if self.looks_like_domain_or_url(word):
-                    return True
-        
-        # Check for common sentence indicators that would disqualify it
-        sentence_indicators = [
-            '. ', '! ', '? ', ', and ', ', or ', ' the ', ' a ', ' an ', 
-            ' is ', ' are ', ' was ', ' were ', ' will ', ' can ', ' could ',
-            ' should ', ' would ', ' may ', ' might ', ' this ', ' that ',
-            ' these ', ' those ', ' with ', ' without ', ' from ', ' into ',
-            ' about ', ' through ', ' during ', ' before ', ' after ', ' over ',
-            ' under ', ' above ', ' below ', ' between ', ' among ', ' within '
-        ]
-        
-        text_lower = text.lower()
-        if any(indicator in text_lower for indicator in sentence_indicators):
-            return False
-        
-        return False
-    
-    def looks_like_url(self, text):
-        """Check if text looks like a URL before validation - comprehensive logic"""
-        text = text.strip()
-        
-        # Empty or very short text
-        if len(text) < 4:
-            return False
-        
-        # Should not be too long (likely paragraph text)
-        if len(text) > 200:
-            return False
-        
-        # Should not contain too many spaces (likely sentence)
-        if text.count(' ') > 2:
-            return False
-        
         # Check for obvious URL patterns first
-        url_indicators = ['http://', 'https://', 'www.', 'ftp://']
-        if any(indicator in text.lower() for indicator in url_indicators):
+        if _URL_INDICATOR_RE.search(text):
             return True
         
         # Check for common sentence indicators that would disqualify it
-        sentence_indicators = [
-            '. ', '! ', '? ', ', and ', ', or ', ' the ', ' a ', ' an ', 
-            ' is ', ' are ', ' was ', ' were ', ' will ', ' can ', ' could ',
-            ' should ', ' would ', ' may ', ' might ', ' this ', ' that ',
-            ' these ', ' those ', ' with ', ' without ', ' from ', ' into ',
-            ' about ', ' through ', ' during ', ' before ', ' after ', ' over ',
-            ' under ', ' above ', ' below ', ' between ', ' among ', ' within '
-        ]
-        
-        text_lower = text.lower()
-        if any(indicator in text_lower for indicator in sentence_indicators):
+        if _SENTENCE_RE.search(text.lower()):
             return False
         
         # Check for domain-like patterns (contains dots and looks like domain)
@@ -337,6 +422,11 @@ class LinkValidator:
         if '/' in word:
             base_part = word.split('/')[0]  # Get just the domain part
         
+        # ASCII domains (nearly all of them) are checked by one regex that
+        # encodes every rule below; other scripts need str.isalpha/isalnum
+        if base_part.isascii():
+            return len(base_part) <= 100 and _DOMAIN_RE.fullmatch(base_part) is not None
+        
         # Split by dots
         parts = base_part.split('.')
         
@@ -359,14 +449,14 @@ class LinkValidator:
             if not part:  # Empty part (like in "example..com")
                 return False
             
-            # Allow letters, numbers, and hyphens (but not at start/end)
-            for char in part:
-                if not (char.isalnum() or char == '-'):
-                    return False
-            
             # Hyphens cannot be at start or end
             if part.startswith('-') or part.endswith('-'):
                 return False
+            
+            # Allow letters, numbers, and inner hyphens; one isalnum() call
+            # checks the whole label in C
+            if not part.replace('-', '').isalnum():
+                return False
         
         # Additional checks
         # Domain should have reasonable length
@@ -404,64 +494,90 @@ class LinkValidator:
             # Detect encoding
             encoding = detect_encoding(file_path)
             encodings = [encoding] + current_config.ENCODING_FALLBACKS
-            lines = None
-            
-            for enc in encodings:
-                try:
-                    with open(file_path, 'r', encoding=enc) as f:
-                        lines = f.readlines()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if lines is None:
-                raise EncodingError(
-                    current_config.ERROR_MESSAGES['encoding_failed'],
-                    file_path=file_path,
-                    tried_encodings=encodings
-                )
-            
-            total = len(lines)
-            progress_interval = get_progress_interval(total)
-            
-            # Use sets to collect unique URLs
-            valid_urls = set()
-            invalid_urls = set()
-            
-            for i, line in enumerate(lines):
-                if self.processing_cancelled:
-                    break
-                    
-                line_str = line.strip()
+            file_size = file_info.get('size_bytes', 0)
+            
+            # The line count is unknown until the scan ends, so the byte size
+            # stands in for the item count when picking a reporting interval
+            progress_interval = get_progress_interval(file_size)
+            
+            with open(file_path, 'rb') as f:
+                # Map large files instead of copying them into memory
+                if file_size >= current_config.MMAP_THRESHOLD_MB * 1024 * 1024:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    # The scan reads front to back; let the OS read ahead
+                    # aggressively and drop pages behind it (not on Windows)
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        data.madvise(mmap.MADV_SEQUENTIAL)
+                else:
+                    data = f.read()
                 
-                # Only process lines that look like URLs
-                if line_str and self.looks_like_url(line_str):
-                    if self.is_valid_url(line_str):
-                        valid_urls.add(line_str)
-                    else:
-                        invalid_urls.add(line_str)
+                # Bound once; this loop runs for every line of the file
+                looks_like_url = self.looks_like_url
+                is_valid_url = self.is_valid_url
                 
-                if progress_callback and i % progress_interval == 0:
-                    progress_callback(i/total)
-            
-            # Ensure final progress update shows 100%
-            if progress_callback:
-                progress_callback(1.0)
+                try:
+                    for enc in encodings:
+                        # Use sets to collect unique URLs
+                        valid_urls = set()
+                        invalid_urls = set()
+                        
+                        try:
+                            ascii_compatible = _is_ascii_compatible(enc)
+                            
+                            # One C-level pass yields every non-empty line
+                            for i, match in enumerate(_LINE_RE.finditer(data)):
+                                if self.processing_cancelled:
+                                    break
+                                
+                                if progress_callback and i % progress_interval == 0:
+                                    progress_callback(match.end() / file_size)
+                                
+                                raw = match.group()
+                                
+                                # ASCII lines decode to themselves, so ones without a
+                                # dot or '://' are rejected before any str is built
+                                if (ascii_compatible and raw.isascii()
+                                        and b'.' not in raw and b'://' not in raw):
+                                    continue
+                                
+                                line_str = raw.decode(enc).strip()
+                                
+                                # Only process new lines that look like URLs;
+                                # repeated URLs are already in one of the sets
+                                if (line_str and line_str not in valid_urls and line_str not in invalid_urls
+                                        and looks_like_url(line_str)):
+                                    if is_valid_url(line_str):
+                                        valid_urls.add(line_str)
+                                    else:
+                                        invalid_urls.add(line_str)
+                            break
+                        except UnicodeDecodeError:
+                            continue
+                    else:
+                        raise EncodingError(
+                            current_config.ERROR_MESSAGES['encoding_failed'],
+                            file_path=file_path,
+                            tried_encodings=encodings
+                        )
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
             
             # Ensure final progress update shows 100%
             if progress_callback:
                 progress_callback(1.0)
             
             # Convert sets to sorted lists
-            results['valid'] = sorted(list(valid_urls))
-            results['invalid'] = sorted(list(invalid_urls))
+            results['valid'] = sorted(valid_urls)
+            results['invalid'] = sorted(invalid_urls)
             
             processing_time = time.time() - start_time
-            self.logger.info(f"Text processing complete: {len(results['valid'])} valid, {len(results['invalid'])} invalid unique URLs")
+            self.logger.info("Text processing complete: %d valid, %d invalid unique URLs",
+                             len(results['valid']), len(results['invalid']))
             
         except Exception as e:
             if not isinstance(e, LinkValidatorError):
-                self.logger.error(f"Unexpected text processing error: {str(e)}")
+                self.logger.error("Unexpected text processing error: %s", e)
                 raise FileProcessingError(f"Text file processing failed: {str(e)}", file_path=file_path, file_type='text')
             raise
         
@@ -491,23 +607,28 @@ class LinkValidator:
             with open(file_path, 'r', encoding=encoding) as f:
                 content = f.read()
             
-            soup = BeautifulSoup(content, 'html.parser')
-            elements = soup.find_all(['a', 'img', 'link', 'script'])
-            total = len(elements)
+            from bs4 import BeautifulSoup, SoupStrainer
+            
+            # Keep only the link-bearing tags instead of building the full tree
+            link_tags = ['a', 'img', 'link', 'script']
+            soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer(link_tags))
+            links = [element.get('href') or element.get('src') for element in soup.find_all(link_tags)]
+            
+            total = len(links)
             progress_interval = get_progress_interval(total)
             
             # Use sets to collect unique URLs
             valid_urls = set()
             invalid_urls = set()
             
-            for i, element in enumerate(elements):
+            for i, url in enumerate(links):
                 if self.processing_cancelled:
                     break
                     
-                url = element.get('href') or element.get('src')
                 if url:
                     url_str = safe_str_conversion(url)
-                    if url_str:
+                    # Repeated links (navigation, assets) are validated once
+                    if url_str and url_str not in valid_urls and url_str not in invalid_urls:
                         if self.is_valid_url(url_str):
                             valid_urls.add(url_str)
                         else:
@@ -517,15 +638,16 @@ class LinkValidator:
                     progress_callback(i/total)
             
             # Convert sets to sorted lists
-            results['valid'] = sorted(list(valid_urls))
-            results['invalid'] = sorted(list(invalid_urls))
+            results['valid'] = sorted(valid_urls)
+            results['invalid'] = sorted(invalid_urls)
             
             processing_time = time.time() - start_time
-            self.logger.info(f"HTML processing complete: {len(results['valid'])} valid, {len(results['invalid'])} invalid unique URLs")
+            self.logger.info("HTML processing complete: %d valid, %d invalid unique URLs",
+                             len(results['valid']), len(results['invalid']))
             
         except Exception as e:
             if not isinstance(e, LinkValidatorError):
-                self.logger.error(f"Unexpected HTML processing error: {str(e)}")
+                self.logger.error("Unexpected HTML processing error: %s", e)
                 raise FileProcessingError(f"HTML processing failed: {str(e)}", file_path=file_path, file_type='html')
             raise
         finally:
@@ -535,6 +657,129 @@ class LinkValidator:
         return results
 
 
+    def process_xml(self, file_path, progress_callback=None):
+        """Process XML files - stream elements and check text and attributes"""
+        results = {'valid': [], 'invalid': []}
+        start_time = time.time()
+        
+        try:
+            validate_file_path(file_path)
+            
+            file_info = get_file_info(file_path)
+            file_size = file_info.get('size_bytes', 0)
+            if file_size > current_config.MAX_FILE_SIZE_MB * 1024 * 1024:
+                raise FileSizeError(
+                    current_config.ERROR_MESSAGES['file_too_large'],
+                    file_path=file_path,
+                    file_size=file_size / (1024 * 1024),
+                    max_size=current_config.MAX_FILE_SIZE_MB
+                )
+            
+            import xml.etree.ElementTree as ET
+            
+            # The element count is unknown until the parse ends, so the byte
+            # size stands in for it when picking a reporting interval
+            progress_interval = get_progress_interval(file_size)
+            
+            # Use sets to collect unique URLs
+            valid_urls = set()
+            invalid_urls = set()
+            
+            try:
+                with open(file_path, 'rb') as f:
+                    # Streamed parse: each element is checked when it closes, along
+                    # with the text after each child, and its children are then
+                    # deleted; the element itself stays attached to its parent
+                    # until the parent closes, so long runs of siblings still
+                    # accumulate (emptied of their own children)
+                    for i, (_, elem) in enumerate(ET.iterparse(f, events=('end',))):
+                        if self.processing_cancelled:
+                            break
+                        
+                        values = [elem.text, *elem.attrib.values()]
+                        values.extend(child.tail for child in elem)
+                        
+                        for value in values:
+                            if not value:
+                                continue
+                            text = value.strip()
+                            
+                            # Only process new values that look like URLs
+                            if text and text not in valid_urls and text not in invalid_urls and self.looks_like_url(text):
+                                if self.is_valid_url(text):
+                                    valid_urls.add(text)
+                                else:
+                                    invalid_urls.add(text)
+                        
+                        del elem[:]
+                        
+                        if progress_callback and file_size and i % progress_interval == 0:
+                            progress_callback(min(f.tell() / file_size, 1.0))
+            except ET.ParseError as e:
+                # .xml files used to go through the forgiving HTML parser, so
+                # ones that are not well-formed XML still get that treatment
+                self.logger.warning("XML parse failed (%s), reading %s as HTML", e, os.path.basename(file_path))
+                return self.process_html(file_path, progress_callback)
+            
+            # Ensure final progress update shows 100%
+            if progress_callback:
+                progress_callback(1.0)
+            
+            # Convert sets to sorted lists
+            results['valid'] = sorted(valid_urls)
+            results['invalid'] = sorted(invalid_urls)
+            
+            processing_time = time.time() - start_time
+            self.logger.info("XML processing complete: %d valid, %d invalid unique URLs",
+                             len(results['valid']), len(results['invalid']))
+            
+        except Exception as e:
+            if not isinstance(e, LinkValidatorError):
+                self.logger.error("Unexpected XML processing error: %s", e)
+                raise FileProcessingError(f"XML processing failed: {str(e)}", file_path=file_path, file_type='xml')
+            raise
+        
+        return results
+
+
+def _is_ascii_compatible(encoding):
+    """Whether ASCII bytes decode to the same characters in this encoding"""
+    try:
+        return _ASCII_PROBE.encode(encoding) == _ASCII_PROBE.encode('ascii')
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _result_cache_key(file_path):
+    """Key for _RESULT_CACHE; it changes whenever the file is rewritten"""
+    st = os.stat(file_path)
+    return (file_path, st.st_mtime_ns, st.st_size)
+
+
+def _get_cached_results(cache_key):
+    """Return stored results for cache_key, marking them recently used"""
+    results = _RESULT_CACHE.get(cache_key)
+    if results is not None:
+        _RESULT_CACHE.move_to_end(cache_key)
+    return results
+
+
+def _store_results(cache_key, results):
+    """Keep results for reuse within the entry and URL-count limits"""
+    url_count = len(results['valid']) + len(results['invalid'])
+    if url_count > current_config.RESULT_CACHE_MAX_URLS:
+        return
+    
+    _RESULT_CACHE[cache_key] = results
+    
+    # Least recently used entries go first
+    total = sum(len(r['valid']) + len(r['invalid']) for r in _RESULT_CACHE.values())
+    while (len(_RESULT_CACHE) > current_config.RESULT_CACHE_SIZE
+           or total > current_config.RESULT_CACHE_MAX_URLS):
+        _, evicted = _RESULT_CACHE.popitem(last=False)
+        total -= len(evicted['valid']) + len(evicted['invalid'])
+
+
 class LinkValidatorApp:
     """Simplified GUI application - just lists of URLs"""
     
@@ -549,11 +794,12 @@ class LinkValidatorApp:
         self.validator = LinkValidator()
         self.processing_thread = None
         self.logger = get_logger()
+        self._progress_active = False
         
         self.create_widgets()
         self.center_window()
         
-        self.logger.info(f"Link Validator v{current_config.APP_VERSION} (Simplified) started")
+        self.logger.info("Link Validator v%s (Simplified) started", current_config.APP_VERSION)
 
     def center_window(self):
         """Center the window on screen"""
@@ -746,7 +992,8 @@ class LinkValidatorApp:
                     ("Text Files", "*.txt"),
                     ("CSV Files", "*.csv"),
                     ("Excel Files", "*.xlsx"),
-                    ("HTML Files", "*.html")
+                    ("HTML Files", "*.html"),
+                    ("XML Files", "*.xml")
                 ]
             )
             
@@ -769,20 +1016,24 @@ class LinkValidatorApp:
             self.clear_results()
             
             # Show processing info
-            self.output_text.insert(tk.END, f"🔍 PROCESSING: {self.current_file_info['name']}\n")
-            self.output_text.insert(tk.END, f"📏 Size: {self.current_file_info['size_formatted']}\n")
-            self.output_text.insert(tk.END, f"⏰ Started: {datetime.now().strftime('%H:%M:%S')}\n\n")
+            self.output_text.insert(
+                tk.END,
+                f"🔍 PROCESSING: {self.current_file_info['name']}\n"
+                f"📏 Size: {self.current_file_info['size_formatted']}\n"
+                f"⏰ Started: {datetime.now().strftime('%H:%M:%S')}\n\n"
+            )
             self.output_text.see(tk.END)
             
             self.update_status("🔄 Processing file...")
             self.set_processing_state(True)
+            self._start_progress_polling()
             
             # Start processing thread
             self.processing_thread = threading.Thread(target=self.process_file, args=(file_path,), daemon=True)
             self.processing_thread.start()
             
         except Exception as e:
-            self.logger.error(f"Error in file selection: {str(e)}")
+            self.logger.error("Error in file selection: %s", e)
             messagebox.showerror("Error", f"Failed to process file: {str(e)}")
             self.update_status("❌ Error occurred")
 
@@ -814,68 +1065,130 @@ class LinkValidatorApp:
         try:
             self.validator.processing_cancelled = False
             
-            # Determine processor
+            # Determine processor; unknown extensions are scanned as text
             file_ext = os.path.splitext(file_path)[1].lower()
+            processor_name = current_config.FILE_PROCESSORS.get(file_ext, 'process_text')
+            processor = getattr(self.validator, processor_name)
             
-            if file_ext == '.csv':
-                processor = self.validator.process_csv
-            elif file_ext in ('.xls', '.xlsx'):
-                processor = self.validator.process_excel
-            elif file_ext in ('.html', '.htm', '.xml'):
-                processor = self.validator.process_html
+            # The file may have gone since it was selected; check it before
+            # its stat is taken for the cache key
+            try:
+                validate_file_path(file_path)
+            except FileNotFoundError:
+                raise FileValidationError(current_config.ERROR_MESSAGES['file_not_found'],
+                                          file_path=file_path) from None
+            
+            # Reuse the previous results while the file is unchanged
+            cache_key = _result_cache_key(file_path)
+            results = _get_cached_results(cache_key)
+            
+            if results is not None:
+                self._stop_progress_polling()
+                self.logger.info("Using cached results for %s", os.path.basename(file_path))
             else:
-                processor = self.validator.process_text
-            
-            # Process
-            results = processor(file_path, self.update_progress)
-            
-            if self.validator.processing_cancelled:
-                self.root.after(0, lambda: self.output_text.insert(tk.END, "\n❌ PROCESSING CANCELLED\n"))
-                self.update_status("❌ Cancelled")
-                return
-            
-            # Ensure progress bar shows 100% when complete
-            self.root.after(0, lambda: self.progress.config(value=100))
-            self.root.after(0, lambda: self.progress_label.config(text="Complete - 100%"))
+                # Process
+                try:
+                    results = processor(file_path, self.update_progress)
+                finally:
+                    self._stop_progress_polling()
+                
+                if self.validator.processing_cancelled:
+                    self.root.after(0, self._show_cancelled)
+                    return
+                
+                _store_results(cache_key, results)
             
             processing_time = time.time() - start_time
             self.results = results
-            self.root.after(0, lambda: self.display_results(results, processing_time))
-            self.update_status(f"✅ Completed in {processing_time:.1f}s")
+            self.root.after(0, self._show_completed, results, processing_time)
             
         except Exception as e:
-            error_msg = f"Processing error: {str(e)}"
-            self.root.after(0, lambda: self.output_text.insert(tk.END, f"\n❌ ERROR: {error_msg}\n"))
-            self.update_status(f"❌ Error: {str(e)}")
-            # Ensure progress bar shows completion even on error
-            self.root.after(0, lambda: self.progress.config(value=100))
-            self.root.after(0, lambda: self.progress_label.config(text="Error"))
-        finally:
-            self.root.after(0, lambda: self.set_processing_state(False))
+            self._stop_progress_polling()
+            self.root.after(0, self._show_error, str(e))
+
+    # The _show_* methods finish a run on the Tk thread; each outcome is
+    # applied in one scheduled callback rather than one per widget
+    def _show_completed(self, results, processing_time):
+        """Show the results of a finished run"""
+        # Ensure progress bar shows 100% when complete
+        self.progress.config(value=100)
+        self.progress_label.config(text="Complete - 100%")
+        self.display_results(results, processing_time)
+        self.update_status(f"✅ Completed in {processing_time:.1f}s")
+        self.set_processing_state(False)
+
+    def _show_cancelled(self):
+        """Show that the run was cancelled"""
+        self.output_text.insert(tk.END, "\n❌ PROCESSING CANCELLED\n")
+        self.update_status("❌ Cancelled")
+        self.set_processing_state(False)
+
+    def _show_error(self, message):
+        """Show the error that ended the run"""
+        self.output_text.insert(tk.END, f"\n❌ ERROR: Processing error: {message}\n")
+        self.update_status(f"❌ Error: {message}")
+        # Ensure progress bar shows completion even on error
+        self.progress.config(value=100)
+        self.progress_label.config(text="Error")
+        self.set_processing_state(False)
 
     def update_progress(self, progress):
-        """Update progress bar"""
+        """Record progress from the worker; _poll_progress shows it"""
+        # A plain attribute write: no closures or cross-thread Tk calls
+        # on the worker's hot path
+        self._progress_value = progress
+
+    def _start_progress_polling(self):
+        """Begin showing worker progress at a fixed cadence"""
+        self._progress_value = None
+        self._progress_shown = None
+        self._progress_label_text = None
+        self._progress_stats_text = None
+        self._progress_active = True
+        self.root.after(current_config.UI_UPDATE_INTERVAL_MS, self._poll_progress)
+
+    def _stop_progress_polling(self):
+        """Stop the poller before the final progress state is posted"""
+        self._progress_active = False
+
+    def _poll_progress(self):
+        """Apply the latest recorded progress on the Tk thread"""
+        if not self._progress_active:
+            return
+        
         try:
-            percent = max(0, min(100, int(progress * 100)))
-            
-            if hasattr(self, '_progress_start_time'):
-                elapsed = time.time() - self._progress_start_time
-                if progress > 0:
-                    estimated_total = elapsed / progress
-                    remaining = estimated_total - elapsed
-                    remaining_str = f" • {remaining:.0f}s remaining" if remaining > 0 else ""
+            progress = self._progress_value
+            if progress is not None and progress != self._progress_shown:
+                self._progress_shown = progress
+                percent = max(0, min(100, int(progress * 100)))
+                
+                if hasattr(self, '_progress_start_time'):
+                    elapsed = time.monotonic() - self._progress_start_time
+                    if progress > 0:
+                        estimated_total = elapsed / progress
+                        remaining = estimated_total - elapsed
+                        remaining_str = f" • {remaining:.0f}s remaining" if remaining > 0 else ""
+                    else:
+                        remaining_str = ""
                 else:
+                    self._progress_start_time = time.monotonic()
                     remaining_str = ""
-            else:
-                self._progress_start_time = time.time()
-                remaining_str = ""
-            
-            self.root.after(0, lambda: self.progress.config(value=percent))
-            self.root.after(0, lambda: self.progress_label.config(text=f"Processing... {percent}%"))
-            self.root.after(0, lambda: self.progress_stats.config(text=remaining_str))
+                
+                # Most polls move the fraction without changing the whole
+                # percent or the rounded ETA; skip the Tk calls for those
+                label_text = f"Processing... {percent}%"
+                if label_text != self._progress_label_text:
+                    self._progress_label_text = label_text
+                    self.progress.config(value=percent)
+                    self.progress_label.config(text=label_text)
+                if remaining_str != self._progress_stats_text:
+                    self._progress_stats_text = remaining_str
+                    self.progress_stats.config(text=remaining_str)
             
         except Exception as e:
-            self.logger.debug(f"Progress update error: {e}")
+            self.logger.debug("Progress update error: %s", e)
+        
+        self.root.after(current_config.UI_UPDATE_INTERVAL_MS, self._poll_progress)
 
     def display_results(self, results, processing_time):
         """Display simplified results - just lists of URLs"""
@@ -883,47 +1196,58 @@ class LinkValidatorApp:
         invalid_count = len(results['invalid'])
         total_count = valid_count + invalid_count
         
+        # Build the whole report first: each Text.insert triggers a re-layout,
+        # so a single insert is far cheaper than one per line
+        parts = []
+        
         # Header
-        self.output_text.insert(tk.END, "🏁 PROCESSING COMPLETE\n")
-        self.output_text.insert(tk.END, "="*80 + "\n\n")
+        parts.append("🏁 PROCESSING COMPLETE\n")
+        parts.append("="*80 + "\n\n")
         
         # Summary
-        self.output_text.insert(tk.END, "📊 SUMMARY\n")
-        self.output_text.insert(tk.END, f"   ⏱️  Processing time: {processing_time:.2f} seconds\n")
-        self.output_text.insert(tk.END, f"   📈 Total unique URLs: {total_count:,}\n")
-        self.output_text.insert(tk.END, f"   ✅ Valid URLs: {valid_count:,}\n")
-        self.output_text.insert(tk.END, f"   ❌ Invalid URLs: {invalid_count:,}\n")
+        parts.append("📊 SUMMARY\n")
+        parts.append(f"   ⏱️  Processing time: {processing_time:.2f} seconds\n")
+        parts.append(f"   📈 Total unique URLs: {total_count:,}\n")
+        parts.append(f"   ✅ Valid URLs: {valid_count:,}\n")
+        parts.append(f"   ❌ Invalid URLs: {invalid_count:,}\n")
         
         if total_count > 0:
             success_rate = (valid_count / total_count) * 100
-            self.output_text.insert(tk.END, f"   📊 Success rate: {success_rate:.1f}%\n")
+            parts.append(f"   📊 Success rate: {success_rate:.1f}%\n")
         
-        self.output_text.insert(tk.END, "\n")
+        parts.append("\n")
         
         # Valid URLs
         if results['valid']:
-            self.output_text.insert(tk.END, "✅ VALID URLS\n")
-            self.output_text.insert(tk.END, "-" * 50 + "\n")
-            for i, url in enumerate(results['valid'], 1):
-                self.output_text.insert(tk.END, f"{i:3d}. {url}\n")
-            self.output_text.insert(tk.END, "\n")
+            parts.append("✅ VALID URLS\n")
+            parts.append("-" * 50 + "\n")
+            parts.extend(f"{i:3d}. {url}\n" for i, url in enumerate(results['valid'], 1))
+            parts.append("\n")
         
         # Invalid URLs
         if results['invalid']:
-            self.output_text.insert(tk.END, "❌ INVALID URLS\n")
-            self.output_text.insert(tk.END, "-" * 50 + "\n")
-            for i, url in enumerate(results['invalid'], 1):
-                self.output_text.insert(tk.END, f"{i:3d}. {url}\n")
-            self.output_text.insert(tk.END, "\n")
+            parts.append("❌ INVALID URLS\n")
+            parts.append("-" * 50 + "\n")
+            parts.extend(f"{i:3d}. {url}\n" for i, url in enumerate(results['invalid'], 1))
+            parts.append("\n")
         
         if not results['valid'] and not results['invalid']:
-            self.output_text.insert(tk.END, "🤷 No URLs found in the file.\n")
+            parts.append("🤷 No URLs found in the file.\n")
         elif not results['invalid']:
-            self.output_text.insert(tk.END, "🎉 All URLs are valid!\n")
+            parts.append("🎉 All URLs are valid!\n")
         
-        self.output_text.insert(tk.END, "="*80 + "\n")
-        self.output_text.insert(tk.END, f"✨ Completed at {datetime.now().strftime('%H:%M:%S')}\n\n")
+        parts.append("="*80 + "\n")
+        parts.append(f"✨ Completed at {datetime.now().strftime('%H:%M:%S')}\n\n")
+        self._insert_chunked("".join(parts))
         self.output_text.see(tk.END)
+    
+    def _insert_chunked(self, text):
+        """Insert text into the output widget in fixed-size blocks"""
+        # Tk re-indexes every line an insert touches; bounded blocks keep a
+        # multi-megabyte report from stalling the widget in one huge call
+        chunk_size = current_config.TEXT_INSERT_CHUNK_CHARS
+        for start in range(0, len(text), chunk_size):
+            self.output_text.insert(tk.END, text[start:start + chunk_size])
 
     def clear_results(self):
         """Clear all results"""
@@ -969,26 +1293,30 @@ class LinkValidatorApp:
         try:
             export_format = os.path.splitext(save_path)[1].lower()
             
+            # The path actually written is known here, so it needs no
+            # existence check afterwards
             if export_format == '.csv' or export_format == '':
-                self._export_csv(save_path if save_path.endswith('.csv') else save_path + '.csv')
+                actual_path = save_path if save_path.endswith('.csv') else save_path + '.csv'
+                self._export_csv(actual_path)
             elif export_format == '.txt':
-                self._export_text(save_path)
+                actual_path = save_path
+                self._export_text(actual_path)
             else:
-                self._export_csv(save_path)
+                actual_path = save_path
+                self._export_csv(actual_path)
             
-            # Get actual file path
-            actual_path = save_path if os.path.exists(save_path) else save_path + '.csv'
+            actual_name = os.path.basename(actual_path)
             total_urls = len(self.results['valid']) + len(self.results['invalid'])
             file_size = os.path.getsize(actual_path)
             
             success_msg = (f"✅ Export completed successfully!\n\n"
-                          f"📄 File: {os.path.basename(actual_path)}\n"
+                          f"📄 File: {actual_name}\n"
                           f"📊 URLs exported: {total_urls:,}\n"
                           f"📏 File size: {file_size:,} bytes\n"
                           f"📁 Location: {actual_path}")
             
             messagebox.showinfo("Export Successful", success_msg)
-            self.update_status(f"✅ Exported {total_urls} URLs to {os.path.basename(actual_path)}")
+            self.update_status(f"✅ Exported {total_urls} URLs to {actual_name}")
             
         except Exception as e:
             error_msg = f"Failed to export results: {str(e)}"
@@ -997,7 +1325,8 @@ class LinkValidatorApp:
 
     def _export_csv(self, save_path):
         """Export results to CSV - simplified format"""
-        with open(save_path, 'w', newline='', encoding='utf-8') as f:
+        with open(save_path, 'w', newline='', encoding='utf-8',
+                  buffering=current_config.EXPORT_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             
             # Header
@@ -1014,17 +1343,14 @@ class LinkValidatorApp:
             writer.writerow(["SUMMARY", f"Valid: {len(self.results['valid'])}, Invalid: {len(self.results['invalid'])}"])
             writer.writerow([])
             
-            # Valid URLs
-            for url in self.results['valid']:
-                writer.writerow(["Valid", url])
-            
-            # Invalid URLs
-            for url in self.results['invalid']:
-                writer.writerow(["Invalid", url])
+            # Valid and invalid URLs; writerows runs the row loop in C
+            writer.writerows(("Valid", url) for url in self.results['valid'])
+            writer.writerows(("Invalid", url) for url in self.results['invalid'])
 
     def _export_text(self, save_path):
         """Export results to text format"""
-        with open(save_path, 'w', encoding='utf-8') as f:
+        with open(save_path, 'w', encoding='utf-8',
+                  buffering=current_config.EXPORT_BUFFER_BYTES) as f:
             f.write(f"URL VALIDATION RESULTS - SIMPLIFIED\n")
             f.write(f"{'='*50}\n\n")
             f.write(f"Generated by: {current_config.APP_NAME} v{current_config.APP_VERSION}\n")
@@ -1040,15 +1366,13 @@ class LinkValidatorApp:
             if self.results['valid']:
                 f.write(f"VALID URLS\n")
                 f.write(f"{'-'*30}\n")
-                for i, url in enumerate(self.results['valid'], 1):
-                    f.write(f"{i:3d}. {url}\n")
+                f.writelines(f"{i:3d}. {url}\n" for i, url in enumerate(self.results['valid'], 1))
                 f.write(f"\n")
             
             if self.results['invalid']:
                 f.write(f"INVALID URLS\n")
                 f.write(f"{'-'*30}\n")
-                for i, url in enumerate(self.results['invalid'], 1):
-                    f.write(f"{i:3d}. {url}\n")
+                f.writelines(f"{i:3d}. {url}\n" for i, url in enumerate(self.results['invalid'], 1))
                 f.write(f"\n")
             
             if not self.results['valid'] and not self.results['invalid']:
@@ -13,6 +13,14 @@ class LinkValidatorLogger:
     def __init__(self):
         self.logger = logging.getLogger('LinkValidator')
         self.setup_logger()
+        
+        # Expose the level methods directly instead of through wrapper
+        # methods, so a log call costs no extra Python frame
+        self.debug = self.logger.debug
+        self.info = self.logger.info
+        self.warning = self.logger.warning
+        self.error = self.logger.error
+        self.critical = self.logger.critical
     
     def setup_logger(self):
         """Configure the logger based on config settings"""
@@ -35,57 +43,37 @@ class LinkValidatorLogger:
         # Prevent propagation to root logger
         self.logger.propagate = False
     
-    def debug(self, message):
-        """Log debug message"""
-        self.logger.debug(message)
-    
-    def info(self, message):
-        """Log info message"""
-        self.logger.info(message)
-    
-    def warning(self, message):
-        """Log warning message"""
-        self.logger.warning(message)
-    
-    def error(self, message):
-        """Log error message"""
-        self.logger.error(message)
-    
-    def critical(self, message):
-        """Log critical message"""
-        self.logger.critical(message)
-    
     def log_file_processing_start(self, file_path, file_info):
         """Log the start of file processing"""
-        self.info(f"Starting processing: {file_info.get('name', 'Unknown')} "
-                 f"({file_info.get('size_formatted', 'Unknown size')})")
-        self.debug(f"Full path: {file_path}")
+        self.info("Starting processing: %s (%s)",
+                  file_info.get('name', 'Unknown'),
+                  file_info.get('size_formatted', 'Unknown size'))
+        self.debug("Full path: %s", file_path)
         if file_info.get('encoding'):
-            self.debug(f"Detected encoding: {file_info['encoding']}")
+            self.debug("Detected encoding: %s", file_info['encoding'])
     
     def log_file_processing_complete(self, results, processing_time):
         """Log the completion of file processing"""
         total_links = results['valid'] + results['invalid']
-        self.info(f"Processing complete in {processing_time:.1f}s - "
-                 f"Total: {total_links}, Valid: {results['valid']}, "
-                 f"Invalid: {results['invalid']}")
+        self.info("Processing complete in %.1fs - Total: %s, Valid: %s, Invalid: %s",
+                  processing_time, total_links, results['valid'], results['invalid'])
     
     def log_validation_stats(self, file_type, total_items, processing_time):
         """Log validation statistics"""
         rate = total_items / processing_time if processing_time > 0 else 0
-        self.debug(f"{file_type} processing: {total_items} items in "
-                  f"{processing_time:.1f}s ({rate:.0f} items/sec)")
+        self.debug("%s processing: %s items in %.1fs (%.0f items/sec)",
+                   file_type, total_items, processing_time, rate)
     
     def log_error_with_context(self, error_type, error_message, context=None):
         """Log error with additional context"""
-        log_msg = f"{error_type}: {error_message}"
         if context:
-            log_msg += f" (Context: {context})"
-        self.error(log_msg)
+            self.error("%s: %s (Context: %s)", error_type, error_message, context)
+        else:
+            self.error("%s: %s", error_type, error_message)
     
     def log_export_operation(self, file_path, record_count):
         """Log export operation"""
-        self.info(f"Exported {record_count} records to {file_path}")
+        self.info("Exported %s records to %s", record_count, file_path)
 
 
 # Create global logger instance
@@ -101,13 +89,13 @@ def log_function_call(func_name, **kwargs):
     """Decorator-style function to log function calls"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            logger.debug(f"Calling {func_name} with args: {args}, kwargs: {kwargs}")
+            logger.debug("Calling %s with args: %s, kwargs: %s", func_name, args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                logger.debug(f"{func_name} completed successfully")
+                logger.debug("%s completed successfully", func_name)
                 return result
             except Exception as e:
-                logger.error(f"{func_name} failed: {str(e)}")
+                logger.error("%s failed: %s", func_name, e)
                 raise
         return wrapper
     return decorator
\ No newline at end of file
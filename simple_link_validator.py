@@ -5,12 +5,52 @@ Use this if the main version has import issues
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-import pandas as pd
 from urllib.parse import urlparse
 import threading
 import csv
 import os
+import re
 from datetime import datetime
+from itertools import repeat
+
+# Rows parsed per pandas chunk, so large CSVs are never loaded whole
+CSV_CHUNK_ROWS = 100000
+
+# Scheme and netloc of an http(s) URL, split where urlparse splits them
+HTTP_NETLOC_RE = re.compile(r'https?://([^/?#]*)', re.IGNORECASE | re.ASCII)
+
+# C0 control characters, which urlparse strips or removes before splitting
+CONTROL_CHAR_RE = re.compile(r'[\x00-\x1f]')
+
+# Per-value outcomes when a CSV column is classified in bulk
+BLANK, VALID, INVALID = 0, 1, 2
+
+# Bytes read per text-file block, so large files are never decoded whole
+TEXT_BLOCK_BYTES = 1024 * 1024
+
+# One line with its terminator, split on the same \n, \r and \r\n
+# boundaries as readlines() in universal-newline mode
+LINE_RE = re.compile(r'[^\r\n]*(?:\r\n?|\n)|[^\r\n]+')
+
+
+# invalid_links entries are (column, row, url) tuples, with column None for
+# text files; they are only turned into report text when shown or exported
+def link_location(column, row):
+    """Describe where an invalid link was found"""
+    if column is None:
+        return f"Invalid link at line {row}"
+    return f"Invalid link in column '{column}', row {row}"
+
+
+def shorten_url(url_str):
+    """Truncate a URL for display"""
+    return f"{url_str[:50]}{'...' if len(url_str) > 50 else ''}"
+
+
+def format_invalid_link(entry):
+    """Render an invalid_links entry as a report line"""
+    column, row, url_str = entry
+    return f"{link_location(column, row)}: {shorten_url(url_str)}"
 
 class SimpleLinkValidator:
     """Simplified URL validation and file processing"""
@@ -20,58 +60,123 @@ class SimpleLinkValidator:
     
     def is_valid_url(self, url):
         """Simple URL validation"""
-        try:
-            if pd.isna(url) or not str(url).strip():
+        # The scanners pass str; anything else is converted defensively,
+        # and url != url catches NaN without importing pandas
+        if not isinstance(url, str):
+            try:
+                if url is None or url != url:
+                    return False
+                url = str(url)
+            except Exception:
                 return False
-                
-            url_str = str(url).strip()
+        
+        url_str = url.strip()
+        if not url_str:
+            return False
+        
+        # An http(s) URL must start with 'h' unless control characters
+        # (which urlparse strips) precede it
+        first = url_str[0]
+        if first != 'h' and first != 'H' and first > ' ':
+            return False
+        
+        # Plain http(s) URLs are settled by one regex match; strings
+        # with control characters (which urlparse strips first),
+        # non-ASCII or bracketed netlocs go through urlparse
+        if not CONTROL_CHAR_RE.search(url_str):
+            match = HTTP_NETLOC_RE.match(url_str)
+            if match is None:
+                return False
+            
+            netloc = match.group(1)
+            if netloc.isascii() and '[' not in netloc and ']' not in netloc:
+                return bool(netloc) and not netloc.startswith('.') and not netloc.endswith('.')
+        
+        try:
             result = urlparse(url_str)
+        except ValueError:
+            # e.g. an unbalanced IPv6 bracket
+            return False
+        
+        # Must have scheme and netloc
+        if not result.scheme or not result.netloc:
+            return False
             
-            # Must have scheme and netloc
-            if not result.scheme or not result.netloc:
-                return False
-                
-            # Accept http/https schemes
-            if result.scheme not in ('http', 'https'):
-                return False
-                
-            # Basic netloc validation
-            netloc = result.netloc.lower()
-            if not netloc or netloc.startswith('.') or netloc.endswith('.'):
-                return False
-                
-            return True
+        # Accept http/https schemes
+        if result.scheme not in ('http', 'https'):
+            return False
             
-        except Exception:
+        # Basic netloc validation; case does not affect the dot checks
+        netloc = result.netloc
+        if not netloc or netloc.startswith('.') or netloc.endswith('.'):
             return False
+            
+        return True
 
     def process_csv(self, file_path, progress_callback=None):
         """Process CSV files"""
         results = {'valid': 0, 'invalid': 0, 'invalid_links': []}
         
         try:
-            df = pd.read_csv(file_path)
-            total = len(df) * len(df.columns)
-            processed = 0
+            import numpy as np
+            import pandas as pd  # deferred so the window opens quickly
+            
+            file_size = os.path.getsize(file_path)
+            
+            # Invalid links are reported column by column, so each column's
+            # entries are kept apart while the file is streamed in chunks
+            column_links = {}
+            
+            # Repeated cells are validated once per file
+            verdicts = {}
             
-            for column in df.columns:
-                if self.processing_cancelled:
-                    break
+            # Cells are only ever compared as text, so type inference is
+            # skipped and every cell is kept as written (e.g. '1', not '1.0'
+            # in a column that also has blanks, whatever chunk it falls in)
+            with open(file_path, 'rb') as f, pd.read_csv(f, dtype=str, chunksize=CSV_CHUNK_ROWS) as reader:
+                for chunk in reader:
+                    for column in chunk.columns:
+                        if self.processing_cancelled:
+                            break
+                        
+                        # Drop missing cells; the chunk's index continues the
+                        # file's RangeIndex, giving the row numbers
+                        series = chunk[column]
+                        present = series[series.notna()]
+                        links = column_links.setdefault(column, [])
+                        
+                        # Each distinct value is stripped and judged once in Python;
+                        # the per-cell counting and selection run on its codes
+                        codes, uniques = pd.factorize(present)
+                        stripped = [value.strip() for value in uniques.tolist()]
+                        kinds = np.empty(len(stripped), dtype=np.int8)
+                        for j, url_str in enumerate(stripped):
+                            if not url_str:
+                                kinds[j] = BLANK
+                                continue
+                            is_valid = verdicts.get(url_str)
+                            if is_valid is None:
+                                is_valid = verdicts[url_str] = self.is_valid_url(url_str)
+                            kinds[j] = VALID if is_valid else INVALID
+                        
+                        cell_kinds = kinds[codes]
+                        invalid = cell_kinds == INVALID
+                        results['valid'] += int(np.count_nonzero(cell_kinds == VALID))
+                        results['invalid'] += int(np.count_nonzero(invalid))
+                        
+                        if invalid.any():
+                            rows = (present.index.to_numpy()[invalid] + 2).tolist()
+                            urls = np.array(stripped, dtype=object)[codes[invalid]].tolist()
+                            links.extend(zip(repeat(column, len(rows)), rows, urls))
                     
-                for index, value in df[column].items():
-                    if pd.notna(value):
-                        url_str = str(value).strip()
-                        if url_str:
-                            if self.is_valid_url(url_str):
-                                results['valid'] += 1
-                            else:
-                                results['invalid'] += 1
-                                results['invalid_links'].append(
-                                    f"Invalid link in column '{column}', row {index + 2}: {url_str[:50]}{'...' if len(url_str) > 50 else ''}"
-                                )
-                    processed += 1
-                    if progress_callback and processed % 100 == 0:
-                        progress_callback(processed/total)
+                    if self.processing_cancelled:
+                        break
+                    
+                    if progress_callback:
+                        progress_callback(min(f.tell() / file_size, 1.0))
+            
+            for links in column_links.values():
+                results['invalid_links'].extend(links)
         
         except Exception as e:
             raise Exception(f"CSV processing error: {str(e)}")
@@ -83,32 +188,69 @@ class SimpleLinkValidator:
         results = {'valid': 0, 'invalid': 0, 'invalid_links': []}
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            total = len(lines)
+            # Repeated lines are validated once per file
+            verdicts = {}
+            line_index = 0
             
-            for i, line in enumerate(lines):
-                if self.processing_cancelled:
-                    break
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                
+                # Decode a block at a time instead of the whole file; blocks end
+                # just after a b'\n', where the UTF-8 decoder holds no state and
+                # no \r can be waiting to join a \r\n, so lines and their numbers
+                # come out exactly as from one read()
+                for block in self._iter_line_blocks(f):
+                    text = block.decode('utf-8', errors='ignore')
                     
-                line_str = line.strip()
-                if line_str:
-                    if self.is_valid_url(line_str):
-                        results['valid'] += 1
-                    else:
-                        results['invalid'] += 1
-                        results['invalid_links'].append(
-                            f"Invalid link at line {i + 1}: {line_str[:50]}{'...' if len(line_str) > 50 else ''}"
-                        )
-                if progress_callback and i % 100 == 0:
-                    progress_callback(i/total)
+                    # Walk the lines in place instead of materializing a list of them
+                    for match in LINE_RE.finditer(text):
+                        if self.processing_cancelled:
+                            break
+                        
+                        line_index += 1
+                        line_str = match.group().strip()
+                        if line_str:
+                            is_valid = verdicts.get(line_str)
+                            if is_valid is None:
+                                is_valid = verdicts[line_str] = self.is_valid_url(line_str)
+                            if is_valid:
+                                results['valid'] += 1
+                            else:
+                                results['invalid'] += 1
+                                results['invalid_links'].append((None, line_index, line_str))
+                    
+                    if self.processing_cancelled:
+                        break
+                    
+                    if progress_callback and size:
+                        progress_callback(f.tell() / size)
         
         except Exception as e:
             raise Exception(f"Text file processing error: {str(e)}")
         
         return results
 
+    @staticmethod
+    def _iter_line_blocks(f):
+        """Yield the bytes of a binary file in blocks that end after a newline"""
+        # Reads without a newline (e.g. CR-only files) are collected in a
+        # list so a long line is joined once rather than re-copied per read
+        pending = []
+        while True:
+            block = f.read(TEXT_BLOCK_BYTES)
+            if not block:
+                if pending:
+                    yield b''.join(pending)
+                return
+            
+            cut = block.rfind(b'\n') + 1
+            if cut:
+                pending.append(block[:cut])
+                yield b''.join(pending)
+                pending = [block[cut:]]
+            else:
+                pending.append(block)
+
 
 class SimpleLinkValidatorApp:
     """Simplified GUI application"""
@@ -121,6 +263,7 @@ class SimpleLinkValidatorApp:
         self.results = None
         self.validator = SimpleLinkValidator()
         self.processing_thread = None
+        self._last_percent = None
         
         self.create_widgets()
         self.center_window()
@@ -240,51 +383,72 @@ class SimpleLinkValidatorApp:
             print(f"Processing complete: {results}")  # Debug
             
             # Update UI in main thread
-            self.root.after(0, lambda: self.display_results(results))
-            self.root.after(0, lambda: self.upload_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.export_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.status_bar.config(text="Processing complete"))
+            self.root.after(0, self._on_done, results)
             
         except Exception as e:
             print(f"Error in process_file: {e}")  # Debug
-            error_msg = f"Error processing file: {str(e)}"
-            self.root.after(0, lambda: self.output_text.insert(tk.END, f"\nERROR: {error_msg}\n"))
-            self.root.after(0, lambda: self.upload_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.status_bar.config(text=f"Error: {str(e)}"))
+            self.root.after(0, self._on_error, str(e))
+
+    def _on_done(self, results):
+        """Show results and re-enable controls on the Tk thread"""
+        self.display_results(results)
+        self.upload_btn.config(state=tk.NORMAL)
+        self.export_btn.config(state=tk.NORMAL)
+        self.status_bar.config(text="Processing complete")
+
+    def _on_error(self, message):
+        """Report a processing error and re-enable upload on the Tk thread"""
+        self.output_text.insert(tk.END, f"\nERROR: Error processing file: {message}\n")
+        self.upload_btn.config(state=tk.NORMAL)
+        self.status_bar.config(text=f"Error: {message}")
 
     def update_progress(self, progress):
         """Update progress bar"""
         try:
             percent = int(progress * 100)
-            self.root.after(0, lambda: self.progress.config(value=percent))
-            self.root.after(0, lambda: self.progress_label.config(text=f"Processing... {percent}%"))
+            
+            # Only marshal a UI update when the visible percentage changes
+            if percent == self._last_percent:
+                return
+            self._last_percent = percent
+            
+            self.root.after(0, self._show_progress, percent)
         except Exception as e:
             print(f"Progress update error: {e}")
 
+    def _show_progress(self, percent):
+        """Apply a progress update on the Tk thread"""
+        self.progress.config(value=percent)
+        self.progress_label.config(text=f"Processing... {percent}%")
+
     def display_results(self, results):
         """Display validation results"""
         try:
             total_links = results['valid'] + results['invalid']
             
-            self.output_text.insert(tk.END, "="*50 + "\n")
-            self.output_text.insert(tk.END, "VALIDATION RESULTS\n")
-            self.output_text.insert(tk.END, "="*50 + "\n\n")
-            self.output_text.insert(tk.END, f"Total links found: {total_links}\n")
-            self.output_text.insert(tk.END, f"Valid links: {results['valid']}\n")
-            self.output_text.insert(tk.END, f"Invalid links: {results['invalid']}\n\n")
+            # Build the report first and insert it in one call; each insert
+            # makes Tk re-layout the widget
+            parts = [
+                "="*50 + "\n",
+                "VALIDATION RESULTS\n",
+                "="*50 + "\n\n",
+                f"Total links found: {total_links}\n",
+                f"Valid links: {results['valid']}\n",
+                f"Invalid links: {results['invalid']}\n\n",
+            ]
             
             if results['invalid_links']:
-                self.output_text.insert(tk.END, "INVALID LINKS:\n")
-                self.output_text.insert(tk.END, "-" * 30 + "\n")
-                for i, link in enumerate(results['invalid_links'][:50], 1):  # Show first 50
-                    self.output_text.insert(tk.END, f"{i}. {link}\n")
+                parts.append("INVALID LINKS:\n")
+                parts.append("-" * 30 + "\n")
+                parts.extend(f"{i}. {format_invalid_link(link)}\n" for i, link in enumerate(results['invalid_links'][:50], 1))  # Show first 50
                 
                 if len(results['invalid_links']) > 50:
                     remaining = len(results['invalid_links']) - 50
-                    self.output_text.insert(tk.END, f"\n... and {remaining} more (use Export to see all)\n")
+                    parts.append(f"\n... and {remaining} more (use Export to see all)\n")
             else:
-                self.output_text.insert(tk.END, "No invalid links found!\n")
+                parts.append("No invalid links found!\n")
             
+            self.output_text.insert(tk.END, "".join(parts))
             self.output_text.see(tk.END)
             self.results = results
             
@@ -312,10 +476,11 @@ class SimpleLinkValidatorApp:
                 writer.writerow(["Status", "Location", "URL"])
                 writer.writerow(["SUMMARY", f"Valid: {self.results['valid']}", f"Invalid: {self.results['invalid']}"])
                 
-                for entry in self.results['invalid_links']:
-                    parts = entry.split(": ", 1)
-                    if len(parts) >= 2:
-                        writer.writerow(["Invalid", parts[0], parts[1]])
+                # Stored (column, row, url) tuples become report rows only here
+                writer.writerows(
+                    ("Invalid", link_location(column, row), shorten_url(url_str))
+                    for column, row, url_str in self.results['invalid_links']
+                )
             
             messagebox.showinfo("Success", f"Results exported to {save_path}")
             
@@ -329,6 +494,7 @@ class SimpleLinkValidatorApp:
         self.export_btn.config(state=tk.DISABLED)
         self.progress['value'] = 0
         self.progress_label.config(text="Ready")
+        self._last_percent = None
 
 
 def main():
@@ -3,19 +3,35 @@ Test suite for Link Validator application
 Run with: python test_link_validator.py
 """
 import unittest
+import importlib.util
 import tempfile
 import os
 import csv
+from unittest import mock
 import pandas as pd
 from openpyxl import Workbook
-from link_validator import LinkValidator
+from link_validator import (
+    LinkValidator, LinkValidatorApp, _RESULT_CACHE, _result_cache_key,
+    _get_cached_results, _store_results
+)
 from utils import (
     detect_encoding, get_progress_interval, safe_str_conversion,
     validate_file_path, get_column_letter, format_file_size
 )
+from config import current_config
+import simple_link_validator
+from simple_link_validator import SimpleLinkValidator
 from exceptions import *
 
 
+def temp_file_for(test_case, data, suffix=''):
+    """Write bytes to a temporary file that is removed after the test"""
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+        f.write(data)
+    test_case.addCleanup(os.unlink, f.name)
+    return f.name
+
+
 class TestLinkValidator(unittest.TestCase):
     """Test cases for LinkValidator class"""
     
@@ -95,6 +111,54 @@ class TestLinkValidator(unittest.TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_csv_chunked_processing(self):
+        """Test CSV files larger than one read chunk"""
+        rows = ["URL,Note"]
+        rows += [f"https://example.com/page{i},row {i}" for i in range(7)]
+        # Repeats in later chunks and a value invalid in a later chunk
+        rows += ["https://example.com/page0,again", "www.example.org,bad", "http://localhost:3000,last"]
+        temp_file = temp_file_for(self, ("\n".join(rows) + "\n").encode('utf-8'), '.csv')
+        
+        whole = self.validator.process_csv(temp_file)
+        with mock.patch.object(current_config, 'CSV_CHUNK_ROWS', 3):
+            progress = []
+            chunked = self.validator.process_csv(temp_file, progress.append)
+        
+        self.assertEqual(chunked, whole)
+        self.assertEqual(len(chunked['valid']), 8)
+        self.assertEqual(chunked['invalid'], ["www.example.org"])
+        self.assertEqual(progress[-1], 1.0)
+        self.assertGreater(len(progress), 2)
+    
+    def test_csv_encoding_retry(self):
+        """Test CSV files whose bytes stop being UTF-8 after the probed head"""
+        head = b"URL,Note\n" + b"https://example.com/a,padding text\n" * 400
+        tail = "https://café.example.com/menu,latin-1 only\n".encode('latin-1')
+        temp_file = temp_file_for(self, head + tail, '.csv')
+        self.assertEqual(detect_encoding(temp_file), 'utf-8')
+        
+        with mock.patch.object(current_config, 'CSV_CHUNK_ROWS', 100):
+            results = self.validator.process_csv(temp_file)
+        
+        self.assertEqual(results['valid'], ["https://café.example.com/menu", "https://example.com/a"])
+        self.assertEqual(results['invalid'], [])
+    
+    def test_csv_mixed_columns(self):
+        """Test CSV files with numeric, text and mixed columns"""
+        content = (
+            "Id,Score,Link,Mixed\n"
+            "1,3.5,https://example.com,12345\n"
+            "2,4.25,not-a-url,http://localhost:8080\n"
+            "3,,example.co.uk,9.75\n"
+            "4,1.0,,www.example.org\n"
+        )
+        temp_file = temp_file_for(self, content.encode('utf-8'), '.csv')
+        
+        results = self.validator.process_csv(temp_file)
+        
+        self.assertEqual(results['valid'], ["http://localhost:8080", "https://example.com"])
+        self.assertEqual(results['invalid'], ["example.co.uk", "www.example.org"])
+    
     def test_excel_processing(self):
         """Test Excel file processing"""
         # Create test Excel file
@@ -134,6 +198,112 @@ class TestLinkValidator(unittest.TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_excel_without_dimensions(self):
+        """Test Excel sheets saved without a dimension record"""
+        import re
+        import zipfile
+        
+        wb = Workbook()
+        ws = wb.active
+        ws['A1'] = "http://example.com"
+        ws['B2'] = "https://google.com"
+        for row in range(3, 13):
+            ws.cell(row=row, column=1, value="plain text")
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+            wb.save(f.name)
+            sized_file = f.name
+        self.addCleanup(os.unlink, sized_file)
+        unsized_file = sized_file.replace('.xlsx', '_unsized.xlsx')
+        
+        # Rewrite the workbook without <dimension>, as some writers produce it
+        with zipfile.ZipFile(sized_file) as zin, zipfile.ZipFile(unsized_file, 'w') as zout:
+            for item in zin.infolist():
+                data = zin.read(item.filename)
+                if item.filename.startswith('xl/worksheets/'):
+                    data = re.sub(rb'<dimension[^>]*/>', b'', data)
+                zout.writestr(item, data)
+        self.addCleanup(os.unlink, unsized_file)
+        
+        progress = []
+        results = self.validator.process_excel(unsized_file, progress.append)
+        self.assertEqual(results['valid'], ["http://example.com", "https://google.com"])
+        self.assertEqual(progress[-1], 1.0)
+    
+    def test_excel_calamine_reader(self):
+        """Test the python-calamine path reads sheets lazily and closes the workbook"""
+        events = []
+        
+        class FakeSheet:
+            def __init__(self, name, rows):
+                self.name = name
+                self.rows = rows
+                self.end = (len(rows) - 1, len(rows[0]) - 1) if rows else None
+            
+            def to_python(self, skip_empty_area=True, nrows=None):
+                events.append(('load', self.name))
+                for row in self.rows[:nrows]:
+                    events.append(('scan', self.name))
+                    yield row
+        
+        class FakeWorkbook:
+            sheets = {
+                'First': FakeSheet('First', [["http://example.com", ""], ["", "not-a-url.invalid"]]),
+                'Empty': FakeSheet('Empty', []),
+                'Second': FakeSheet('Second', [[1.5, "https://google.com", True]]),
+            }
+            sheet_names = list(sheets)
+            closed = False
+            
+            @classmethod
+            def from_path(cls, path):
+                return cls()
+            
+            def get_sheet_by_name(self, name):
+                return self.sheets[name]
+            
+            def close(self):
+                FakeWorkbook.closed = True
+        
+        fake_module = mock.Mock(CalamineWorkbook=FakeWorkbook)
+        temp_file = temp_file_for(self, b"not read by the fake reader", '.xlsx')
+        
+        with mock.patch.dict('sys.modules', {'python_calamine': fake_module}):
+            progress = []
+            results = self.validator.process_excel(temp_file, progress.append)
+        
+        self.assertEqual(results, {'valid': ["http://example.com", "https://google.com"],
+                                   'invalid': ["not-a-url.invalid"]})
+        self.assertEqual(events, [('load', 'First'), ('scan', 'First'), ('scan', 'First'),
+                                  ('load', 'Empty'), ('load', 'Second'), ('scan', 'Second')])
+        self.assertTrue(FakeWorkbook.closed)
+        self.assertEqual(progress[-1], 1.0)
+    
+    @unittest.skipUnless(importlib.util.find_spec('python_calamine'), "python-calamine is not installed")
+    def test_excel_calamine_matches_openpyxl(self):
+        """Test python-calamine and openpyxl give the same results"""
+        wb = Workbook()
+        ws = wb.active
+        ws['C3'] = "http://example.com"
+        ws['D5'] = "www.bad"
+        ws['A1'] = 42
+        other = wb.create_sheet("Other")
+        other['B2'] = "https://google.com"
+        wb.create_sheet("Empty")
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+            wb.save(f.name)
+            temp_file = f.name
+        self.addCleanup(os.unlink, temp_file)
+        
+        with mock.patch.object(current_config, 'MAX_EXCEL_ROWS', 4):
+            calamine_results = self.validator.process_excel(temp_file)
+            with mock.patch.dict('sys.modules', {'python_calamine': None}):
+                openpyxl_results = self.validator.process_excel(temp_file)
+        
+        self.assertEqual(calamine_results, openpyxl_results)
+        self.assertEqual(calamine_results['valid'], ["http://example.com", "https://google.com"])
+    
     def test_text_processing(self):
         """Test text file processing"""
         test_content = """http://example.com
@@ -164,6 +334,50 @@ https://github.com"""
         finally:
             os.unlink(temp_file)
     
+    def test_text_mmap_processing(self):
+        """Test the memory-mapped text scan against the in-memory read"""
+        fixtures = {
+            'crlf': (b"https://example.com\r\nnot a url.\r\nwww.bad\r\n\r\nhttp://localhost:3000\r\n",
+                     ["http://localhost:3000", "https://example.com"], ["www.bad"]),
+            'mixed endings': (b"https://a.example.com\rwww.example.org\nhttps://b.example.com\r\n",
+                              ["https://a.example.com", "https://b.example.com"], ["www.example.org"]),
+            'no final newline': (b"plain words\nhttps://example.com/first\nhttps://example.com/last",
+                                 ["https://example.com/first", "https://example.com/last"], []),
+            # The UTF-8 probe only sees the head; the scan then retries as Latin-1
+            'latin-1 fallback': (b"https://example.com/a\n" * 500 + "https://café.example.com\n".encode('latin-1'),
+                                 ["https://café.example.com", "https://example.com/a"], []),
+        }
+        
+        for name, (content, valid, invalid) in fixtures.items():
+            with self.subTest(fixture=name):
+                temp_file = temp_file_for(self, content, '.txt')
+                
+                with mock.patch.object(current_config, 'MMAP_THRESHOLD_MB', 10 ** 6):
+                    in_memory = self.validator.process_text(temp_file)
+                with mock.patch.object(current_config, 'MMAP_THRESHOLD_MB', 0):
+                    mapped = self.validator.process_text(temp_file)
+                
+                self.assertEqual(mapped, in_memory)
+                self.assertEqual(mapped, {'valid': valid, 'invalid': invalid})
+    
+    def test_text_non_ascii_lines(self):
+        """Test that the ASCII byte pre-filter still decodes lines with non-ASCII bytes"""
+        # Non-ASCII URLs between ASCII lines the pre-filter skips
+        content = "no dots here\nhttps://münchen.example/straße\nplain\nwww.bücher.example\nend\n"
+        temp_file = temp_file_for(self, content.encode('utf-8'), '.txt')
+        results = self.validator.process_text(temp_file)
+        self.assertEqual(results, {'valid': ["https://münchen.example/straße"],
+                                   'invalid': ["www.bücher.example"]})
+        
+        # A Latin-1 line with no dot must still be decoded, so its bytes fail
+        # UTF-8 and the whole file is read with the next fallback
+        content = (b"https://example.com/a\n" * 500 + "https://naïve.example.com\n".encode('utf-8')
+                   + "café menü\n".encode('latin-1'))
+        temp_file = temp_file_for(self, content, '.txt')
+        results = self.validator.process_text(temp_file)
+        self.assertEqual(results['valid'], ["https://example.com/a",
+                                            "https://naïve.example.com".encode('utf-8').decode('latin-1')])
+    
     def test_html_processing(self):
         """Test HTML file processing"""
         html_content = """<!DOCTYPE html>
@@ -202,6 +416,51 @@ https://github.com"""
         finally:
             os.unlink(temp_file)
 
+    
+    def test_xml_processing(self):
+        """Test XML file processing"""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset>
+    <url><loc>https://example.com/page</loc></url>
+    <url><loc>http://localhost:8080/status</loc></url>
+    <link href="https://cdn.example.com/feed.xml"/>
+    <note>Visit <b>here</b> www.example.org</note>
+    <bad>http://.invalid</bad>
+    <plain>not a url at all</plain>
+</urlset>"""
+        temp_file = temp_file_for(self, xml_content.encode('utf-8'), '.xml')
+        
+        results = self.validator.process_xml(temp_file)
+        
+        self.assertEqual(results['valid'], [
+            "http://localhost:8080/status",
+            "https://cdn.example.com/feed.xml",
+            "https://example.com/page",
+        ])
+        self.assertEqual(results['invalid'], ["http://.invalid", "www.example.org"])
+
+    def test_html_truncated_utf8_tail(self):
+        """Test an HTML file ending mid-character is read as Latin-1"""
+        temp_file = temp_file_for(self, b'<a href="http://example.com">caf\xc3', '.html')
+        
+        results = self.validator.process_html(temp_file)
+        
+        self.assertEqual(results['valid'], ["http://example.com"])
+        self.assertEqual(results['invalid'], [])
+    
+    def test_xml_html_fallback(self):
+        """Test .xml files that are not well-formed fall back to the HTML parser"""
+        fixtures = {
+            'html entity': b'<root><a href="https://example.com/a">x &nbsp; <br></root>',
+            'truncated': b'<feed><link href="https://example.com/a"/><entry><a href="not-a-url">',
+        }
+        
+        for name, content in fixtures.items():
+            with self.subTest(fixture=name):
+                temp_file = temp_file_for(self, content, '.xml')
+                results = self.validator.process_xml(temp_file)
+                self.assertEqual(results, self.validator.process_html(temp_file))
+                self.assertIn("https://example.com/a", results['valid'])
 
 class TestUtilityFunctions(unittest.TestCase):
     """Test cases for utility functions"""
@@ -290,6 +549,23 @@ class TestUtilityFunctions(unittest.TestCase):
         # Test with empty path
         with self.assertRaises(ValueError):
             validate_file_path("")
+    
+    def test_detect_encoding(self):
+        """Test encoding detection from the file head"""
+        test_cases = [
+            ("https://example.com\n".encode('utf-8'), 'utf-8'),
+            ("https://café.example\n".encode('utf-8'), 'utf-8'),
+            ("https://café.example\n".encode('latin-1'), 'latin-1'),
+            # A character split by the probe read is still UTF-8
+            (b"a" * (current_config.ENCODING_PROBE_BYTES - 1) + "é".encode('utf-8'), 'utf-8'),
+            # A file that itself ends mid-character is not
+            (b'<a href="http://example.com">caf\xc3', 'latin-1'),
+        ]
+        
+        for content, expected in test_cases:
+            with self.subTest(expected=expected, size=len(content)):
+                temp_file = temp_file_for(self, content)
+                self.assertEqual(detect_encoding(temp_file), expected)
 
 
 class TestExceptions(unittest.TestCase):
@@ -321,6 +597,191 @@ class TestExceptions(unittest.TestCase):
         self.assertEqual(str(error), "File missing")
 
 
+class TestResultCache(unittest.TestCase):
+    """Test cases for reusing results of unchanged files"""
+    
+    def setUp(self):
+        """Start every test with an empty cache"""
+        _RESULT_CACHE.clear()
+        self.addCleanup(_RESULT_CACHE.clear)
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("URL\nhttp://example.com\nnot-a-url.invalid\n")
+            self.temp_file = f.name
+        self.addCleanup(os.unlink, self.temp_file)
+    
+    def _make_app(self):
+        """Build an app with the Tk parts replaced, enough for process_file"""
+        app = LinkValidatorApp.__new__(LinkValidatorApp)
+        app.root = mock.Mock()
+        app.logger = mock.Mock()
+        app.validator = LinkValidator()
+        app._stop_progress_polling = mock.Mock()
+        return app
+    
+    def test_hit_and_miss(self):
+        """Test an unchanged file is processed once and then reused"""
+        app = self._make_app()
+        with mock.patch.object(app.validator, 'process_csv', wraps=app.validator.process_csv) as process_csv:
+            app.process_file(self.temp_file)
+            app.process_file(self.temp_file)
+        
+        self.assertEqual(process_csv.call_count, 1)
+        first, second = [c.args for c in app.root.after.call_args_list]
+        self.assertEqual(first[1], app._show_completed)
+        self.assertIs(second[2], first[2])
+        self.assertEqual(first[2]['valid'], ["http://example.com"])
+    
+    def test_changed_file_is_a_miss(self):
+        """Test a new mtime or size gives a new key"""
+        key = _result_cache_key(self.temp_file)
+        _store_results(key, {'valid': [], 'invalid': []})
+        
+        st = os.stat(self.temp_file)
+        os.utime(self.temp_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertIsNone(_get_cached_results(_result_cache_key(self.temp_file)))
+        
+        with open(self.temp_file, 'a') as f:
+            f.write("https://google.com\n")
+        self.assertIsNone(_get_cached_results(_result_cache_key(self.temp_file)))
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entries are dropped past the limits"""
+        def results(count):
+            return {'valid': [f"http://example.com/{i}" for i in range(count)], 'invalid': []}
+        
+        with mock.patch.object(current_config, 'RESULT_CACHE_SIZE', 2), \
+                mock.patch.object(current_config, 'RESULT_CACHE_MAX_URLS', 10):
+            _store_results('a', results(1))
+            _store_results('b', results(1))
+            _get_cached_results('a')
+            _store_results('c', results(1))
+            self.assertEqual(list(_RESULT_CACHE), ['a', 'c'])
+            
+            # The URL budget evicts as well, and oversized results are not kept
+            _store_results('d', results(10))
+            self.assertEqual(list(_RESULT_CACHE), ['d'])
+            _store_results('e', results(11))
+            self.assertEqual(list(_RESULT_CACHE), ['d'])
+    
+    def test_missing_file_message(self):
+        """Test a file removed after selection reports the configured message"""
+        app = self._make_app()
+        app.process_file(self.temp_file + ".missing")
+        
+        app.root.after.assert_called_once_with(
+            0, app._show_error, current_config.ERROR_MESSAGES['file_not_found'])
+
+
+class TestSimpleLinkValidator(unittest.TestCase):
+    """Test cases for the simplified validator's file processing"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.validator = SimpleLinkValidator()
+    
+    def test_csv_processing(self):
+        """Test CSV cells are counted and reported column by column"""
+        temp_file = temp_file_for(
+            self, b"URL,Note\n"
+            b"http://example.com,Valid URL\n"
+            b"not-a-url,https://google.com\n"
+            b",  \n"
+            b"  https://example.com/  ,www.example.org\n"
+            b"http://localhost:3000,not-a-url\n", '.csv')
+        
+        results = self.validator.process_csv(temp_file)
+        
+        self.assertEqual(results['valid'], 4)
+        self.assertEqual(results['invalid'], 4)
+        self.assertEqual(results['invalid_links'], [
+            ('URL', 3, 'not-a-url'),
+            ('Note', 2, 'Valid URL'),
+            ('Note', 5, 'www.example.org'),
+            ('Note', 6, 'not-a-url'),
+        ])
+    
+    def test_text_processing(self):
+        """Test text lines are numbered across every newline style and blank lines"""
+        temp_file = temp_file_for(
+            self, b"http://example.com\r\nnot-a-url\n\nhttps://google.com\rwww.example.org\n"
+            b"http://example.com\n  spaced  \nlast-line", '.txt')
+        
+        results = self.validator.process_text(temp_file)
+        
+        self.assertEqual(results['valid'], 3)
+        self.assertEqual(results['invalid'], 4)
+        self.assertEqual(results['invalid_links'], [
+            (None, 2, 'not-a-url'),
+            (None, 5, 'www.example.org'),
+            (None, 7, 'spaced'),
+            (None, 8, 'last-line'),
+        ])
+    
+    def test_text_line_across_block_boundary(self):
+        """Test a line that straddles a read block is kept whole"""
+        filler = b"http://example.com\n"
+        count = simple_link_validator.TEXT_BLOCK_BYTES // len(filler)
+        data = filler * count + b"not-a-url-straddling\n" + b"https://example.com/\xc3\xa9\r\n"
+        self.assertLess(len(filler) * count, simple_link_validator.TEXT_BLOCK_BYTES)
+        self.assertGreater(len(filler) * count + 20, simple_link_validator.TEXT_BLOCK_BYTES)
+        temp_file = temp_file_for(self, data, '.txt')
+        
+        results = self.validator.process_text(temp_file)
+        
+        self.assertEqual(results['valid'], count + 1)
+        self.assertEqual(results['invalid_links'], [(None, count + 1, 'not-a-url-straddling')])
+    
+    def test_csv_values_repeated_across_chunks(self):
+        """Test repeated and padded values are judged alike in every chunk"""
+        temp_file = temp_file_for(
+            self, b"A,B\n"
+            b"not-a-url,1\n"
+            b"http://example.com,\n"
+            b" not-a-url ,2.5\n"
+            b"not-a-url,NA\n"
+            b"http://example.com,x\n"
+            b",3\n", '.csv')
+        expected = [
+            ('A', 2, 'not-a-url'),
+            ('A', 4, 'not-a-url'),
+            ('A', 5, 'not-a-url'),
+            ('B', 2, '1'),
+            ('B', 4, '2.5'),
+            ('B', 6, 'x'),
+            ('B', 7, '3'),
+        ]
+        
+        for chunk_rows in (simple_link_validator.CSV_CHUNK_ROWS, 2, 1):
+            with self.subTest(chunk_rows=chunk_rows), \
+                    mock.patch.object(simple_link_validator, 'CSV_CHUNK_ROWS', chunk_rows):
+                results = self.validator.process_csv(temp_file)
+                self.assertEqual(results['valid'], 2)
+                self.assertEqual(results['invalid'], 7)
+                self.assertEqual(results['invalid_links'], expected)
+    
+    def test_csv_numbers_kept_as_written(self):
+        """Test numeric cells are reported as written, even beside missing ones"""
+        temp_file = temp_file_for(self, b"N\n1\nNA\n2\n007\n", '.csv')
+        
+        results = self.validator.process_csv(temp_file)
+        
+        self.assertEqual(results['invalid_links'], [('N', 2, '1'), ('N', 4, '2'), ('N', 5, '007')])
+    
+    def test_text_small_blocks(self):
+        """Test every block size gives the lines of a single read"""
+        temp_file = temp_file_for(
+            self, b"http://a.example.com\r\nbad\xff line\rhttps://example.com/\xe2\x82\xac\r\n\r\nlast", '.txt')
+        
+        # Small blocks split \r\n pairs and multi-byte characters between reads
+        for block_bytes in (simple_link_validator.TEXT_BLOCK_BYTES, 1, 2, 3, 5):
+            with self.subTest(block_bytes=block_bytes), \
+                    mock.patch.object(simple_link_validator, 'TEXT_BLOCK_BYTES', block_bytes):
+                results = self.validator.process_text(temp_file)
+                self.assertEqual(results['valid'], 2)
+                self.assertEqual(results['invalid_links'], [(None, 2, 'bad line'), (None, 5, 'last')])
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     
@@ -376,6 +837,8 @@ def run_tests():
         TestLinkValidator,
         TestUtilityFunctions,
         TestExceptions,
+        TestResultCache,
+        TestSimpleLinkValidator,
         TestIntegration
     ]
     
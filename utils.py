@@ -1,8 +1,10 @@
 """
 Utility functions for the Link Validator application
 """
-import pandas as pd
+import codecs
 import os
+import stat
+from config import current_config
 
 
 def detect_encoding(file_path):
@@ -13,22 +15,22 @@ def detect_encoding(file_path):
         file_path (str): Path to the file
         
     Returns:
-        str: Detected encoding or 'utf-8' as fallback
+        str: Detected encoding or 'latin-1' as fallback
     """
-    # Try common encodings in order
-    encodings_to_try = ['utf-8', 'latin-1', 'cp1252', 'ascii']
+    # One read of the file head; a text-mode probe decodes a chunk of the
+    # same size, so the verdict is unchanged for UTF-8 and Latin-1 files
+    with open(file_path, 'rb') as f:
+        head = f.read(current_config.ENCODING_PROBE_BYTES)
     
-    for encoding in encodings_to_try:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                # Try to read first 1000 characters
-                f.read(1000)
-            return encoding
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    
-    # If all fail, return utf-8 as fallback
-    return 'utf-8'
+    try:
+        # Incremental decoding tolerates a character cut off by the read, but
+        # a head shorter than the probe is the whole file and must end cleanly
+        final = len(head) < current_config.ENCODING_PROBE_BYTES
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=final)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        # Latin-1 maps every byte, so it cannot fail
+        return 'latin-1'
 
 
 def get_progress_interval(total):
@@ -41,16 +43,11 @@ def get_progress_interval(total):
     Returns:
         int: Interval for progress reporting
     """
-    if total < 100:
-        return 5
-    elif total < 1000:
-        return 25
-    elif total < 10000:
-        return 100
-    elif total < 100000:
-        return 500
-    else:
-        return 1000
+    # Thresholds come from Config.PROGRESS_INTERVALS, smallest limit first
+    for limit, interval in sorted(current_config.PROGRESS_INTERVALS.values()):
+        if total < limit:
+            return interval
+    return 1000
 
 
 def safe_str_conversion(value):
@@ -63,22 +60,43 @@ def safe_str_conversion(value):
     Returns:
         str: String representation or empty string if invalid
     """
+    # Common cell types are converted by one dict lookup; anything else
+    # (numpy scalars, NA markers, dates) takes the general path
+    converter = _STR_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    
+    import pandas as pd  # deferred: importing pandas dominates startup time
+    
     if pd.isna(value) or value is None:
         return ""
     
     # Handle numeric types that might be URLs stored as numbers
     if isinstance(value, (int, float)):
-        if isinstance(value, float) and (value != value):  # NaN check
-            return ""
-        # Convert float to int if it's a whole number
-        if isinstance(value, float) and value.is_integer():
-            return str(int(value))
-        return str(value)
+        return _float_to_str(value) if isinstance(value, float) else str(value)
     
     # Handle other types
     return str(value).strip()
 
 
+def _float_to_str(value):
+    """Convert a float, dropping NaN and the '.0' of whole numbers"""
+    if value != value:  # NaN check
+        return ""
+    # Convert float to int if it's a whole number
+    if value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+_STR_CONVERTERS = {
+    str: str.strip,
+    int: str,
+    float: _float_to_str,
+    type(None): lambda value: "",
+}
+
+
 def validate_file_path(file_path):
     """
     Validate file path before processing
@@ -96,13 +114,16 @@ def validate_file_path(file_path):
     if not file_path:
         raise ValueError("File path cannot be empty")
     
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # One stat call answers the existence, type and size checks
+    try:
+        file_stats = os.stat(file_path)
+    except (OSError, ValueError):
+        raise FileNotFoundError(f"File not found: {file_path}") from None
     
-    if not os.path.isfile(file_path):
+    if not stat.S_ISREG(file_stats.st_mode):
         raise ValueError(f"Path is not a file: {file_path}")
     
-    if os.path.getsize(file_path) == 0:
+    if file_stats.st_size == 0:
         raise ValueError("File is empty")
     
     return True
@@ -118,6 +139,14 @@ def get_column_letter(col_num):
     Returns:
         str: Column letter(s) (A, B, ..., Z, AA, AB, etc.)
     """
+    # Columns up to ZZ are a table lookup; wider ones are spelled out
+    if 0 < col_num <= len(_COLUMN_LETTERS):
+        return _COLUMN_LETTERS[col_num - 1]
+    return _spell_column_letter(col_num)
+
+
+def _spell_column_letter(col_num):
+    """Build the column letter(s) for col_num one base-26 digit at a time"""
     result = ""
     while col_num > 0:
         col_num -= 1
@@ -126,6 +155,10 @@ def get_column_letter(col_num):
     return result
 
 
+# A..ZZ, built once at import; MAX_EXCEL_COLS is well inside this range
+_COLUMN_LETTERS = tuple(_spell_column_letter(n) for n in range(1, 703))
+
+
 def format_file_size(size_bytes):
     """
     Format file size in human readable format
@@ -138,27 +171,30 @@ def format_file_size(size_bytes):
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    
+    # Each unit is 10 more bits, so bit_length picks it without a ladder;
+    # GB is the largest unit shown
+    unit = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
 
 
-def is_large_file(file_path, threshold_mb=10):
+def is_large_file(file_path, threshold_mb=10, file_stats=None):
     """
     Check if file is considered large
     
     Args:
         file_path (str): Path to file
         threshold_mb (int): Threshold in megabytes
+        file_stats (os.stat_result): Stat result already taken for file_path
         
     Returns:
         bool: True if file is larger than threshold
     """
     try:
-        size_bytes = os.path.getsize(file_path)
+        size_bytes = file_stats.st_size if file_stats is not None else os.path.getsize(file_path)
         size_mb = size_bytes / (1024 * 1024)
         return size_mb > threshold_mb
     except Exception:
@@ -182,7 +218,7 @@ def get_file_info(file_path):
             'size_bytes': file_stats.st_size,
             'size_formatted': format_file_size(file_stats.st_size),
             'extension': os.path.splitext(file_path)[1].lower(),
-            'is_large': is_large_file(file_path),
+            'is_large': is_large_file(file_path, file_stats=file_stats),
             'encoding': detect_encoding(file_path) if file_path.endswith('.txt') else None
         }
     except Exception as e: